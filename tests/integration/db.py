@@ -31,7 +31,6 @@ scheme was adopted.
 """
 from __future__ import absolute_import
 
-import base64
 import datetime
 import hashlib
 import hmac
@@ -47,6 +46,12 @@ import boto3
 import botocore
 from botocore.exceptions import ClientError
 
+try:
+    # SIMD-accelerated drop-in for the stdlib encoder
+    from pybase64 import urlsafe_b64encode
+except ImportError:  # pragma: nocover
+    from base64 import urlsafe_b64encode
+
 # Autopush Exceptions:
 
 
@@ -137,7 +142,7 @@ def base64url_encode(value: bytes | str) -> str:
     if isinstance(value, str):
         value = bytes(value, "utf-8")
     """Encodes an unpadded Base64 URL-encoded string per RFC 7515."""
-    return base64.urlsafe_b64encode(value).strip(b"=").decode("utf-8")
+    return urlsafe_b64encode(value).strip(b"=").decode("utf-8")
 
 
 # Max DynamoDB record lifespan (~ 30 days)
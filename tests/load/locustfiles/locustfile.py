@@ -5,17 +5,17 @@
 """Performance test module."""
 
 import base64
-import json
 import logging
+import os
 import random
-import string
+import re
 import time
 import uuid
-from json import JSONDecodeError
 from logging import Logger
-from typing import Any, TypeAlias
+from typing import Annotated, Any, Callable, TypeAlias
 
 import gevent
+import orjson
 import websocket
 from args import parse_wait_time
 from exceptions import ZeroStatusRequestError
@@ -30,18 +30,24 @@ from models import (
     RegisterRecord,
     UnregisterMessage,
 )
-from pydantic import ValidationError
-from websocket import WebSocketApp, WebSocketConnectionClosedException
+from pydantic import Field, TypeAdapter, ValidationError
+from websocket import ABNF, WebSocketConnectionClosedException, WebSocketTimeoutException
 
 Message: TypeAlias = HelloMessage | NotificationMessage | RegisterMessage | UnregisterMessage
 Record: TypeAlias = HelloRecord | NotificationRecord | RegisterRecord
 
+# Built once at import; rebuilding validators per message is a known cost
+MESSAGE_ADAPTER: TypeAdapter = TypeAdapter(Annotated[Message, Field(discriminator="messageType")])
+
 # Set to 'True' to view the verbose connection information for the web socket
 websocket.enableTrace(False)
 websocket.setdefaulttimeout(5)
 
 logger: Logger = logging.getLogger("AutopushUser")
 
+# Extracts the 'messageType' value without parsing the entire message
+MESSAGE_TYPE_PATTERN: re.Pattern = re.compile(rb'"messageType"\s*:\s*"(\w+)"')
+
 
 @events.init_command_line_parser.add_listener
 def _(parser: Any):
@@ -71,9 +77,17 @@ def _(parser: Any):
 @events.test_start.add_listener
 def _(environment, **kwargs):
     environment.autopush_wait_time = parse_wait_time(environment.parsed_options.wait_time)
+    # Per-task logging is measurable overhead at high user counts
+    logger.setLevel(logging.WARNING)
 
 
 class AutopushUser(FastHttpUser):
+    # Prefixes random payloads to more easily differentiate them
+    PAYLOAD_PREFIX: str = "TestData"
+    # Fail stuck endpoint requests well before FastHttp's 60 s defaults
+    # so they don't pin greenlets
+    network_timeout: float = 10.0
+    connection_timeout: float = 10.0
     REST_HEADERS: dict[str, str] = {"TTL": "60", "Content-Encoding": "aes128gcm"}
     WEBSOCKET_HEADERS: dict[str, str] = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.13; rv:61.0) "
@@ -83,13 +97,32 @@ class AutopushUser(FastHttpUser):
     def __init__(self, environment) -> None:
         super().__init__(environment)
         self.channels: dict[str, str] = {}
+        # List mirrors of self.channels so hot tasks can random.choice
+        # without materializing list(dict) per call
+        self._channel_ids: list[str] = []
+        self._channel_urls: list[str] = []
+        self._channel_index: dict[str, int] = {}
         self.hello_record: HelloRecord | None = None
-        self.notification_records: list[NotificationRecord] = []
-        self.register_records: list[RegisterRecord] = []
-        self.unregister_records: list[RegisterRecord] = []
+        # Keyed for O(1) lookup in recv; popping also keeps them from
+        # growing for the lifetime of the user
+        self.notification_records: dict[str, NotificationRecord] = {}
+        self.register_records: dict[str, RegisterRecord] = {}
+        self.unregister_records: dict[str, RegisterRecord] = {}
         self.uaid: str = ""
-        self.ws: WebSocketApp | None = None
+        # context() builds a fresh dict per call; evaluated once since
+        # it is fired with every send and recv event
+        self._context: dict[str, Any] = self.context()
+        # FastHttp keeps one session per user, so the headers dict is
+        # passed through by reference; bind it once to skip the class
+        # attribute walk in the hot task
+        self._rest_headers: dict[str, str] = self.REST_HEADERS
+        self._pending_acks: list[dict[str, str]] = []
+        # Sliced into notification payloads; built once so the hot send
+        # path does no urandom or base64 work
+        self._payload_pool: str = base64.b64encode(os.urandom(8192)).decode("ascii")
+        self.ws: websocket.WebSocket | None = None
         self.ws_greenlet: Greenlet | None = None
+        self._ws_stop: bool = False
 
     def wait_time(self):
         return self.environment.autopush_wait_time(self)
@@ -100,7 +133,9 @@ class AutopushUser(FastHttpUser):
 
     def on_stop(self) -> Any:
         """Called when a User stops running."""
+        self._ws_stop = True
         if self.ws:
+            self.flush_acks(self.ws)
             for channel_id in self.channels.keys():
                 self.send_unregister(self.ws, channel_id)
             self.ws.close()
@@ -108,7 +143,7 @@ class AutopushUser(FastHttpUser):
         if self.ws_greenlet:
             gevent.kill(self.ws_greenlet)
 
-    def on_ws_open(self, ws: WebSocketApp) -> None:
+    def on_ws_open(self, ws: websocket.WebSocket) -> None:
         """Called when opening a WebSocket.
 
         Args:
@@ -116,25 +151,54 @@ class AutopushUser(FastHttpUser):
         """
         self.send_hello(ws)
 
-    def on_ws_message(self, ws: WebSocketApp, data: str) -> None:
+    def on_ws_message(self, ws: websocket.WebSocket, data: bytes) -> None:
         """Called when received data from a WebSocket.
 
         Args:
             ws: WebSocket class object
-            data: utf-8 data received from the server
+            data: utf-8 encoded bytes received from the server
         """
         message: Message | None = self.recv(data)
         if isinstance(message, HelloMessage):
             self.uaid = message.uaid
         elif isinstance(message, NotificationMessage):
-            self.send_ack(ws, message.channelID, message.version)
+            self.queue_ack(ws, message.channelID, message.version)
         elif isinstance(message, RegisterMessage):
-            self.channels[message.channelID] = message.pushEndpoint
+            self.add_channel(message.channelID, message.pushEndpoint)
         elif isinstance(message, UnregisterMessage):
-            del self.channels[message.channelID]
+            self.remove_channel(message.channelID)
+
+    def add_channel(self, channel_id: str, endpoint_url: str) -> None:
+        """Track a registered channel and its endpoint.
+
+        Args:
+            channel_id: Channel ID of the registered channel
+            endpoint_url: Channel destination endpoint url
+        """
+        self.channels[channel_id] = endpoint_url
+        self._channel_index[channel_id] = len(self._channel_ids)
+        self._channel_ids.append(channel_id)
+        self._channel_urls.append(endpoint_url)
 
-    def on_ws_error(self, ws: WebSocketApp, error: Exception) -> None:
-        """Called when there is a WebSocketApp error or if an exception is raised in a WebSocket
+    def remove_channel(self, channel_id: str) -> None:
+        """Forget an unregistered channel.
+
+        Args:
+            channel_id: Channel ID of the unregistered channel
+        """
+        del self.channels[channel_id]
+        # Swap-with-last keeps removal O(1)
+        index: int = self._channel_index.pop(channel_id)
+        last_id: str = self._channel_ids[-1]
+        if last_id != channel_id:
+            self._channel_ids[index] = last_id
+            self._channel_urls[index] = self._channel_urls[-1]
+            self._channel_index[last_id] = index
+        self._channel_ids.pop()
+        self._channel_urls.pop()
+
+    def on_ws_error(self, ws: websocket.WebSocket, error: Exception) -> None:
+        """Called when there is a WebSocket error or if an exception is raised in a WebSocket
         callback function.
 
         Args:
@@ -152,7 +216,7 @@ class AutopushUser(FastHttpUser):
         )
 
     def on_ws_close(
-        self, ws: WebSocketApp, close_status_code: int | None, close_msg: str | None
+        self, ws: websocket.WebSocket, close_status_code: int | None, close_msg: str | None
     ) -> None:
         """Called when closing a WebSocket.
 
@@ -161,6 +225,9 @@ class AutopushUser(FastHttpUser):
             close_status_code: WebSocket close status
             close_msg: WebSocket close message
         """
+        # Pending ack updates belong to the closed connection; a new
+        # connection must not replay them
+        self._pending_acks.clear()
         if close_status_code or close_msg:
             logger.info(f"WebSocket closed. status={close_status_code} msg={close_msg}")
 
@@ -168,17 +235,15 @@ class AutopushUser(FastHttpUser):
     def send_notification(self):
         """Sends a notification to a registered endpoint while connected to Autopush."""
         if not self.ws or not self.channels:
-            logger.debug("Task 'send_notification' skipped.")
             return
 
-        endpoint_url: str = random.choice(list(self.channels.values()))
+        endpoint_url: str = random.choice(self._channel_urls)
         self.post_notification(endpoint_url)
 
     @task(weight=1)
     def subscribe(self):
         """Subscribes a user to an Autopush channel."""
         if not self.ws:
-            logger.debug("Task 'subscribe' skipped.")
             return
 
         channel_id: str = str(uuid.uuid4())
@@ -188,25 +253,54 @@ class AutopushUser(FastHttpUser):
     def unsubscribe(self):
         """Unsubscribes a user from an Autopush channel."""
         if not self.ws or not self.channels:
-            logger.debug("Task 'unsubscribe' skipped.")
             return
 
-        channel_id: str = random.choice(list(self.channels.keys()))
+        channel_id: str = random.choice(self._channel_ids)
         self.send_unregister(self.ws, channel_id)
 
     def connect(self) -> None:
-        """Creates the WebSocketApp that will run indefinitely."""
-        self.ws = websocket.WebSocketApp(
-            self.environment.parsed_options.websocket_url,
-            header=self.WEBSOCKET_HEADERS,
-            on_message=self.on_ws_message,
-            on_error=self.on_ws_error,
-            on_close=self.on_ws_close,
-            on_open=self.on_ws_open,
-        )
+        """Connect and dispatch WebSocket frames until the user stops.
 
-        # If reconnect is set to 0 (default) the WebSocket will not reconnect.
-        self.ws.run_forever(reconnect=1)
+        A plain WebSocket read loop replaces WebSocketApp, which routes
+        every frame through a stack of callback wrappers; recv_data also
+        hands over raw bytes that feed the validator without a decode.
+        """
+        url: str = self.environment.parsed_options.websocket_url
+        while not self._ws_stop:
+            ws = websocket.WebSocket()
+            try:
+                # The module default timeout bounds the handshake and each
+                # recv so a dead connection can't pin the greenlet forever
+                ws.connect(
+                    url, header=self.WEBSOCKET_HEADERS, timeout=websocket.getdefaulttimeout()
+                )
+                self.ws = ws
+                self.on_ws_open(ws)
+                while not self._ws_stop:
+                    try:
+                        opcode, frame_data = ws.recv_data()
+                    except WebSocketTimeoutException:
+                        # Idle connection; not an error, keep waiting
+                        continue
+                    if opcode in (ABNF.OPCODE_TEXT, ABNF.OPCODE_BINARY):
+                        self.on_ws_message(ws, frame_data)
+                    elif opcode == ABNF.OPCODE_CLOSE:
+                        break
+            except WebSocketConnectionClosedException as error:
+                # WebSocket closures are expected; don't flood the log
+                logger.debug(str(error))
+            except Exception as error:
+                self.on_ws_error(ws, error)
+            finally:
+                self.ws = None
+                self.on_ws_close(ws, None, None)
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+            if not self._ws_stop:
+                # Mirrors the reconnect=1 pacing WebSocketApp provided
+                gevent.sleep(1)
 
     def post_notification(self, endpoint_url: str) -> None:
         """Send a notification to Autopush.
@@ -218,22 +312,23 @@ class AutopushUser(FastHttpUser):
                                     sending a notification.
         """
         message_type: str = "notification"
-        # Prefix random message with 'TestData' to more easily differentiate the payload
-        data: str = "TestData" + "".join(
-            [
-                random.choice(string.ascii_letters + string.digits)
-                for i in range(0, random.randrange(1024, 4096, 2) - 8)
-            ]
-        )
-
-        record = NotificationRecord(send_time=time.perf_counter(), data=data)
-        self.notification_records.append(record)
+        # Slicing a random window out of the per-user pool leaves only a
+        # concat and a copy per send; windows rarely repeat
+        size: int = random.randrange(1024, 4096, 2) - len(self.PAYLOAD_PREFIX)
+        offset: int = random.randrange(0, len(self._payload_pool) - size)
+        data: str = self.PAYLOAD_PREFIX + self._payload_pool[offset : offset + size]
+
+        record = NotificationRecord(send_time=time.perf_counter_ns(), data=data)
+        # Keyed by the base64url form the server echoes back, unpadded,
+        # so recv can look it up without decoding the message data
+        encoded_data: str = base64.urlsafe_b64encode(data.encode("ascii")).rstrip(b"=").decode()
+        self.notification_records[encoded_data] = record
 
         with self.client.post(
             url=endpoint_url,
             name=message_type,
             data=data,
-            headers=self.REST_HEADERS,
+            headers=self._rest_headers,
             catch_response=True,
         ) as response:
             if response.status_code == 0:
@@ -241,13 +336,34 @@ class AutopushUser(FastHttpUser):
             if response.status_code != 201:
                 response.failure(f"{response.status_code=}, expected 201, {response.text=}")
 
-    def recv(self, data: str) -> Message | None:
+    def _hello_handler(self, message: HelloMessage) -> HelloRecord | None:
+        return self.hello_record
+
+    def _notification_handler(self, message: NotificationMessage) -> NotificationRecord | None:
+        return self.notification_records.pop(message.data, None)
+
+    def _register_handler(self, message: RegisterMessage) -> RegisterRecord | None:
+        return self.register_records.pop(message.channelID, None)
+
+    def _unregister_handler(self, message: UnregisterMessage) -> RegisterRecord | None:
+        return self.unregister_records.pop(message.channelID, None)
+
+    # Record lookup per message type; a dict dispatches faster than
+    # walking match/case arms on every inbound frame
+    _RECORD_HANDLERS: dict[str, Callable[..., Record | None]] = {
+        "hello": _hello_handler,
+        "notification": _notification_handler,
+        "register": _register_handler,
+        "unregister": _unregister_handler,
+    }
+
+    def recv(self, data: bytes) -> Message | None:
         """Verify the contents of an Autopush message and report response statistics to Locust.
 
         Args:
-            data: utf-8 data received from the server
+            data: utf-8 encoded bytes received from the server
         """
-        recv_time: float = time.perf_counter()
+        recv_time: int = time.perf_counter_ns()
         exception: str | None = None
         message: Message | None = None
         message_type: str = "unknown"
@@ -255,78 +371,69 @@ class AutopushUser(FastHttpUser):
         response_time: float = 0
 
         try:
-            message_dict: dict[str, Any] = json.loads(data)
-            message_type = message_dict.get("messageType", "unknown")
-            match message_type:
-                case "hello":
-                    message = HelloMessage(**message_dict)
-                    record = self.hello_record
-                case "notification":
-                    message = NotificationMessage(**message_dict)
-                    message_data: str = message.data
-                    decode_data: str = base64.urlsafe_b64decode(message_data + "===").decode(
-                        "utf8"
-                    )
-                    record = next(
-                        (r for r in self.notification_records if r.data == decode_data), None
-                    )
-                case "register":
-                    message = RegisterMessage(**message_dict)
-                    register_chid: str = message.channelID
-                    record = next(
-                        (r for r in self.register_records if r.channel_id == register_chid),
-                        None,
-                    )
-                case "unregister":
-                    message = UnregisterMessage(**message_dict)
-                    unregister_chid: str = message.channelID
-                    record = next(
-                        (r for r in self.unregister_records if r.channel_id == unregister_chid),
-                        None,
-                    )
-                case _:
-                    exception = f"Unexpected data was received. Data: {data}"
-
+            message = MESSAGE_ADAPTER.validate_json(data)
+            message_type = message.messageType
+            record = self._RECORD_HANDLERS[message_type](self, message)
             if record:
-                response_time = (recv_time - record.send_time) * 1000
+                # Integer ns throughout; convert to ms only when reporting
+                response_time = (recv_time - record.send_time) / 1_000_000
             else:
                 exception = f"There is no record of the '{message_type}' message"
                 logger.error(f"{exception}. Contents: {message}")
-        except (ValidationError, JSONDecodeError) as error:
+        except ValidationError as error:
             exception = str(error)
+            type_match: re.Match | None = MESSAGE_TYPE_PATTERN.search(data)
+            if type_match:
+                message_type = type_match.group(1).decode()
 
         self.environment.events.request.fire(
             request_type="WSS",
             name=f"{message_type} - recv",
             response_time=response_time,
-            response_length=len(data.encode("utf-8")),
+            # Messages are ASCII (base64 payloads + JSON), so character
+            # count equals byte count without an encode copy
+            response_length=len(data),
             exception=exception,
-            context=self.context(),
+            context=self._context,
         )
 
         return message
 
-    def send_ack(self, ws: WebSocketApp, channel_id: str, version: str) -> None:
-        """Send an 'ack' message to Autopush.
+    def queue_ack(self, ws: websocket.WebSocket, channel_id: str, version: str) -> None:
+        """Queue an 'ack' message update to Autopush.
 
         After sending a notification, the client must also send an 'ack' to the server
-        to confirm receipt.
+        to confirm receipt. The 'ack' schema takes a list of updates, so acks for
+        notifications arriving in a burst coalesce into one message sent
+        shortly after the first arrives.
 
         Args:
             ws: WebSocket class object
             channel_id: Notification message channel ID
             version: Notification message version
+        """
+        self._pending_acks.append(dict(channelID=channel_id, version=version))
+        if len(self._pending_acks) == 1:
+            gevent.spawn_later(0.005, self.flush_acks, ws)
+
+    def flush_acks(self, ws: websocket.WebSocket) -> None:
+        """Send one 'ack' message covering all pending updates.
+
+        Args:
+            ws: WebSocket class object
         Raises:
             WebSocketException: Error raised by the WebSocket client
         """
+        # A stale timer must not drain acks queued on a newer connection
+        if not self._pending_acks or ws is not self.ws:
+            return
         message_type: str = "ack"
-        data: dict[str, Any] = dict(
-            messageType=message_type,
-            updates=[dict(channelID=channel_id, version=version)],
-        )
+        updates: list[dict[str, str]]
+        updates, self._pending_acks = self._pending_acks, []
+        data: dict[str, Any] = dict(messageType=message_type, updates=updates)
         self.send(ws, message_type, data)
 
-    def send_hello(self, ws: WebSocketApp) -> None:
+    def send_hello(self, ws: websocket.WebSocket) -> None:
         """Send a 'hello' message to Autopush.
 
         Connections must say hello after connecting to the server, otherwise the connection is
@@ -342,12 +449,12 @@ class AutopushUser(FastHttpUser):
             messageType=message_type,
             use_webpush=True,
             uaid=self.uaid,
-            channelIDs=list(self.channels.keys()),
+            channelIDs=self._channel_ids,
         )
-        self.hello_record = HelloRecord(send_time=time.perf_counter())
+        self.hello_record = HelloRecord(send_time=time.perf_counter_ns())
         self.send(ws, message_type, data)
 
-    def send_register(self, ws: WebSocketApp, channel_id: str) -> None:
+    def send_register(self, ws: websocket.WebSocket, channel_id: str) -> None:
         """Send a 'register' message to Autopush.
 
         Args:
@@ -358,11 +465,11 @@ class AutopushUser(FastHttpUser):
         """
         message_type: str = "register"
         data: dict[str, Any] = dict(messageType=message_type, channelID=channel_id)
-        record = RegisterRecord(send_time=time.perf_counter(), channel_id=channel_id)
-        self.register_records.append(record)
+        record = RegisterRecord(send_time=time.perf_counter_ns(), channel_id=channel_id)
+        self.register_records[channel_id] = record
         self.send(ws, message_type, data)
 
-    def send_unregister(self, ws: WebSocketApp, channel_id: str) -> None:
+    def send_unregister(self, ws: websocket.WebSocket, channel_id: str) -> None:
         """Send an 'unregister' message to Autopush.
 
         Args:
@@ -373,11 +480,11 @@ class AutopushUser(FastHttpUser):
         """
         message_type: str = "unregister"
         data: dict[str, Any] = dict(messageType=message_type, channelID=channel_id)
-        record = RegisterRecord(send_time=time.perf_counter(), channel_id=channel_id)
-        self.unregister_records.append(record)
+        record = RegisterRecord(send_time=time.perf_counter_ns(), channel_id=channel_id)
+        self.unregister_records[channel_id] = record
         self.send(ws, message_type, data)
 
-    def send(self, ws: WebSocketApp, message_type: str, data: dict[str, Any]) -> None:
+    def send(self, ws: websocket.WebSocket, message_type: str, data: dict[str, Any]) -> None:
         """Send a message to Autopush.
 
         Args:
@@ -388,7 +495,8 @@ class AutopushUser(FastHttpUser):
             WebSocketException: Error raised by the WebSocket client
         """
         try:
-            ws.send(json.dumps(data))
+            # orjson serializes in C; decode because the server expects text frames
+            ws.send(orjson.dumps(data).decode())
         except WebSocketConnectionClosedException as error:
             # WebSocket closures are expected
             # Don't send the exception to the UI it creates too much clutter
@@ -400,5 +508,5 @@ class AutopushUser(FastHttpUser):
             response_time=0,
             response_length=0,
             exception=None,
-            context=self.context(),
+            context=self._context,
         )
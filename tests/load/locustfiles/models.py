@@ -22,7 +22,7 @@ class HelloMessage(BaseModel):
 class HelloRecord(BaseModel):
     """Record of 'hello' message sent to Autopush."""
 
-    send_time: float
+    send_time: int
 
 
 class NotificationMessage(BaseModel):
@@ -38,7 +38,7 @@ class NotificationMessage(BaseModel):
 class NotificationRecord(BaseModel):
     """Record of 'notification' posted to Autopush."""
 
-    send_time: float
+    send_time: int
     data: str
 
 
@@ -54,7 +54,7 @@ class RegisterMessage(BaseModel):
 class RegisterRecord(BaseModel):
     """Record of 'register' message sent to Autopush."""
 
-    send_time: float
+    send_time: int
     channel_id: str
 
 